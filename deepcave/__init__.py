@@ -114,6 +114,11 @@ if any(file in _exec_file for file in _exec_files):
         config_name = sys.argv[sys.argv.index("--config") + 1]
     config = parse_config(config_name)
 
+    # Dash serializes the callback outputs with plotly, which is much faster using orjson
+    import plotly.io as pio
+
+    pio.json.config.default_engine = "orjson"
+
     # Create app
     app = get_app(config.TITLE)
     queue = Queue(config.REDIS_ADDRESS, config.REDIS_PORT)
@@ -45,6 +45,7 @@ class Config:
     SAVE_IMAGES: bool
     FIGURE_MARGIN: Dict
     FIGURE_HEIGHT: str
+    FAST_IMPORTANCE_RANKING: bool
     REDIS_PORT: int
     REDIS_ADDRESS: str
     DASH_PORT: int
@@ -73,6 +74,11 @@ class Config:
     FIGURE_DOWNLOAD_SCALE = 4.0
     FIGURE_FONT_SIZE = 20
 
+    # Plugin related
+    # Whether importances, which are only used to order hyperparameters, are approximated with
+    # fewer trees and trials.
+    FAST_IMPORTANCE_RANKING: bool = True
+
     # Redis settings
     REDIS_PORT: int = 6379
     REDIS_ADDRESS: str = "redis://localhost"
@@ -28,6 +28,7 @@ fANOVA can be used for analyzing the importances of Hyperparameters.
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import itertools as it
+import math
 
 import numpy as np
 import pyrfr
@@ -229,16 +230,19 @@ class FanovaForest(RandomForest):
             prod_midpoints = it.product(*midpoints)
             prod_sizes = it.product(*sizes)
 
-            sample: np.ndarray = np.full(self.n_params, np.nan, dtype=float)
+            # pyrfr expects a list, so the sample is kept as one instead of converting
+            # an array for every single prediction
+            sample: List[float] = [np.nan] * self.n_params
 
             # make prediction for all midpoints and weigh them by the corresponding size
-            for i, (m, s) in enumerate(zip(prod_midpoints, prod_sizes)):
-                sample[list(hp_ids)] = list(m)
-
-                ls = self._model.marginal_prediction_stat_of_tree(tree_idx, sample.tolist())
-                # self.logger.debug("%s, %s", (sample, ls.mean()))
-                if not np.isnan(ls.mean()):
-                    stat.push(ls.mean(), np.prod(np.array(s)) * ls.sum_of_weights())
+            for m, s in zip(prod_midpoints, prod_sizes):
+                for hp_id, value in zip(hp_ids, m):
+                    sample[hp_id] = float(value)
+
+                ls = self._model.marginal_prediction_stat_of_tree(tree_idx, sample)
+                mean = ls.mean()
+                if not math.isnan(mean):
+                    stat.push(mean, math.prod(s) * ls.sum_of_weights())
 
             # line 10 in algorithm 2
             # note that V_U^2 can be computed by var(\hat a)^2 - \sum_{subU} var(f_subU)^2
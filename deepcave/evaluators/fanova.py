@@ -73,6 +73,7 @@ class fANOVA:
         budget: Optional[Union[int, float]] = None,
         n_trees: int = 16,
         seed: int = 0,
+        max_samples: Optional[int] = None,
     ) -> None:
         """
         Get the data with respect to budget and train the forest on the encoded data.
@@ -91,6 +92,10 @@ class fANOVA:
             How many trees should be used. By default 16.
         seed : int
             Random seed. By default 0.
+        max_samples : Optional[int], optional
+            Maximum number of data points the forest is trained on. If more data points are
+            available, a random subset (drawn with `seed`) is used. By default None (all data
+            points are used).
         """
         if objectives is None:
             objectives = self.run.get_objectives()
@@ -104,6 +109,9 @@ class fANOVA:
         df = self.run.get_encoded_data(
             objectives, budget, specific=True, include_combined_cost=True
         )
+        if max_samples is not None and len(df) > max_samples:
+            df = df.sample(n=max_samples, random_state=seed)
+
         X = df[self.hp_names].to_numpy()
         # Combined cost name includes the cost of all selected objectives
         Y = df[COMBINED_COST_NAME].to_numpy()
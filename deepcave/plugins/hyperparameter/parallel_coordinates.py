@@ -23,28 +23,173 @@ This module provides utilities for visualizing the parallel coordinates.
     - ParallelCoordinates : Can be used for visualizing the parallel coordinates.
 """
 
-from typing import Any, Callable, Dict, List
-
-from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import dash_bootstrap_components as dbc
 import numpy as np
 import pandas as pd
 import plotly.graph_objs as go
+from ConfigSpace.hyperparameters import Hyperparameter
 from dash import dcc, html
 from dash.exceptions import PreventUpdate
+from plotly.colors import get_colorscale
 
 from deepcave import config
 from deepcave.constants import VALUE_RANGE
-from deepcave.evaluators.fanova import fANOVA
 from deepcave.plugins.static import StaticPlugin
+from deepcave.runs import AbstractRun
+from deepcave.runs.objective import Objective
 from deepcave.utils.compression import deserialize, serialize
+from deepcave.utils.hash import string_to_hash
 from deepcave.utils.layout import get_checklist_options, get_select_options, help_button
 from deepcave.utils.logs import get_logger
+from deepcave.utils.run_caches import load_from_run_cache, save_to_run_cache
 from deepcave.utils.styled_plotty import get_hyperparameter_ticks, save_image
 
 logger = get_logger(__name__)
 
+# Settings of the quick fANOVA used to order the hyperparameters
+FANOVA_N_TREES = 10
+FANOVA_SEED = 0
+# Only the ranking of the hyperparameters is used, which is stable with fewer trees and trials
+FAST_FANOVA_N_TREES = 5
+FAST_FANOVA_MAX_SAMPLES = 2000
+FANOVA_CACHE_ID = "parallel_coordinates_fanova"
+DATA_CACHE_ID = "parallel_coordinates_data"
+
+# Ticks only depend on the definition of a hyperparameter, not on the trials
+_hyperparameter_ticks: Dict[str, Tuple[Tuple, Tuple]] = {}
+
+
+def _get_ticks(hp: Hyperparameter) -> Tuple[Tuple, Tuple]:
+    """
+    Get the ticks of a hyperparameter.
+
+    The ticks are computed once per hyperparameter definition and reused afterwards.
+
+    Parameters
+    ----------
+    hp : Hyperparameter
+        The hyperparameter to get the ticks for.
+
+    Returns
+    -------
+    Tuple[Tuple, Tuple]
+        tickvals and ticktext.
+    """
+    key = str(hp)
+    if key not in _hyperparameter_ticks:
+        tickvals, ticktext = get_hyperparameter_ticks(hp, ticks=4, include_nan=True)
+        _hyperparameter_ticks[key] = (tuple(tickvals), tuple(ticktext))
+
+    return _hyperparameter_ticks[key]
+
+
+def _get_plot_values(values: np.ndarray) -> np.ndarray:
+    """
+    Get the values in the precision used for plotting.
+
+    The plot can not show more details than float32 provides, which roughly halves the size of
+    the serialized figure. Non-float values are returned as they are.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The values to plot.
+
+    Returns
+    -------
+    np.ndarray
+        The values to plot, downcasted to float32 if they are floats.
+    """
+    if pd.api.types.is_float_dtype(values):
+        return values.astype(np.float32)
+
+    return values
+
+
+def _get_data(run: AbstractRun, objective: Objective, budget: Union[int, float]) -> str:
+    """
+    Get the serialized encoded data, averaged over the seeds of a configuration.
+
+    The data are kept in the run cache per run state, objective and budget.
+
+    Parameters
+    ----------
+    run : AbstractRun
+        The run to get the data from.
+    objective : Objective
+        The objective to get the data for.
+    budget : Union[int, float]
+        The budget to get the data for.
+
+    Returns
+    -------
+    str
+        The serialized dataframe.
+    """
+    key = string_to_hash(f"{run.hash}:{len(run.history)}:{objective.name}:{budget}")
+    cached = load_from_run_cache(run, DATA_CACHE_ID, key)
+    if cached is not None:
+        return cached["df"]
+
+    df = run.get_encoded_data(objective, budget)
+    df = df.groupby(df.columns.drop(objective.name).to_list(), as_index=False).mean()
+    df = serialize(df)
+    save_to_run_cache(run, DATA_CACHE_ID, key, {"df": df})
+
+    return df
+
+
+def _get_importances(
+    run: AbstractRun, objective: Objective, budget: Union[int, float]
+) -> Dict[str, float]:
+    """
+    Get the mean fANOVA importances of the hyperparameters.
+
+    If `FAST_IMPORTANCE_RANKING` is set in the config, fewer trees and trials are used.
+
+    Parameters
+    ----------
+    run : AbstractRun
+        The run to calculate the importances for.
+    objective : Objective
+        The objective to calculate the importances for.
+    budget : Union[int, float]
+        The budget to calculate the importances for.
+
+    Returns
+    -------
+    Dict[str, float]
+        The mean importance of each hyperparameter.
+    """
+    if config.FAST_IMPORTANCE_RANKING:
+        n_trees, max_samples = FAST_FANOVA_N_TREES, FAST_FANOVA_MAX_SAMPLES
+    else:
+        n_trees, max_samples = FANOVA_N_TREES, None
+
+    # The run state is part of the key, so that results of an outdated run are never reused
+    key = string_to_hash(
+        f"{run.hash}:{len(run.history)}:{objective.name}:{budget}:"
+        f"{n_trees}:{max_samples}:{FANOVA_SEED}"
+    )
+    importances = load_from_run_cache(run, FANOVA_CACHE_ID, key)
+    if importances is not None:
+        return importances
+
+    # The evaluator pulls in pyrfr and scikit-learn, which are only needed if this is reached
+    from deepcave.evaluators.fanova import fANOVA
+
+    evaluator = fANOVA(run)
+    evaluator.calculate(
+        objective, budget, n_trees=n_trees, seed=FANOVA_SEED, max_samples=max_samples
+    )
+    importances_dict = evaluator.get_importances()
+    importances = {u: v[0] for u, v in importances_dict.items()}
+    save_to_run_cache(run, FANOVA_CACHE_ID, key, importances)
+
+    return importances
+
 
 class ParallelCoordinates(StaticPlugin):
     """Can be used for visualizing the parallel coordinates."""
@@ -303,17 +448,11 @@ class ParallelCoordinates(StaticPlugin):
         """
         budget = run.get_budget(inputs["budget_id"])
         objective = run.get_objective(inputs["objective_id"])
-        df = run.get_encoded_data(objective, budget)
-        df = df.groupby(df.columns.drop(objective.name).to_list(), as_index=False).mean()
-        df = serialize(df)
-        result: Dict[str, Any] = {"df": df}
+        result: Dict[str, Any] = {"df": _get_data(run, objective, budget)}
 
         if inputs["show_important_only"]:
             # Let's run a quick fANOVA here
-            evaluator = fANOVA(run)
-            evaluator.calculate(objective, budget, n_trees=10, seed=0)
-            importances_dict = evaluator.get_importances()
-            importances = {u: v[0] for u, v in importances_dict.items()}
+            importances = _get_importances(run, objective, budget)
             important_hp_names = sorted(
                 importances, key=lambda key: importances[key], reverse=False
             )
@@ -383,63 +522,74 @@ class ParallelCoordinates(StaticPlugin):
         if show_important_only:
             hp_names = outputs["important_hp_names"]
             # cut off from the left side to cut off the least important hyperparameters first
-            show_n_hps = len(hp_names) - n_hps
+            show_n_hps = max(len(hp_names) - n_hps, 0)
             hp_names = hp_names[show_n_hps:]
         else:
-            hp_names = inputs["hyperparameter_names"]
-            hp_names = hp_names[n_hps:]
-
-        df = outputs["df"]
-        df = deserialize(df, dtype=pd.DataFrame)
-        objective_values = []
-        for value in df[objective_name].values:
-            b = np.isnan(value)
-            if not show_unsuccessful:
-                b = not b
-            if b:
-                objective_values += [value]
-
-        data: defaultdict = defaultdict(dict)
-        for hp_name in hp_names:
-            values = []
-            for hp_v, objective_v in zip(df[hp_name].values, df[objective_name].values):
-                b = np.isnan(objective_v)
-                if not show_unsuccessful:
-                    b = not b
-                if b:
-                    values += [hp_v]
-
-            data[hp_name]["values"] = values
-            data[hp_name]["label"] = hp_name
-            data[hp_name]["range"] = VALUE_RANGE
-
-            hp = run.configspace[hp_name]
-            tickvals, ticktext = get_hyperparameter_ticks(hp, ticks=4, include_nan=True)
-
-            data[hp_name]["tickvals"] = tickvals
-            data[hp_name]["ticktext"] = ticktext
+            # Only the first n_hps of the selected hyperparameters are shown
+            hp_names = inputs["hyperparameter_names"][:n_hps]
+
+        # Only the shown hyperparameters are needed. They are read as one array with a row per
+        # column, so that the values of each dimension are stored contiguously.
+        columns = [objective_name] + list(hp_names)
+        df = deserialize(outputs["df"], dtype=pd.DataFrame, columns=columns)
+        values = np.ascontiguousarray(df.to_numpy().T)
+
+        # Unsuccessful trials are the ones without an objective value
+        mask = np.isnan(values[0])
+        if not show_unsuccessful:
+            mask = ~mask
+        values = _get_plot_values(values[:, mask])
+        objective_values = values[0]
+
+        dimensions: List[Dict[str, Any]] = []
+        for hp_name, hp_values in zip(hp_names, values[1:]):
+            tickvals, ticktext = _get_ticks(run.configspace[hp_name])
+
+            dimensions.append(
+                {
+                    "values": hp_values,
+                    "label": hp_name,
+                    "range": VALUE_RANGE,
+                    "tickvals": tickvals,
+                    "ticktext": ticktext,
+                }
+            )
 
         if show_unsuccessful:
             line = dict()
         else:
-            data[objective_name]["values"] = objective_values
-            data[objective_name]["label"] = objective_name
+            dimensions.append({"values": objective_values, "label": objective_name})
             line = dict(
-                color=data[objective_name]["values"],
+                color=objective_values,
                 showscale=True,
-                colorscale="aggrnyl",
+                colorscale=get_colorscale("aggrnyl"),
             )
 
+        # Plotly keeps the user's state (e.g. the drawn filters) while the uirevision stays the
+        # same. The filters are matched to the dimensions by their position, not their label.
+        # Hence, the state is only kept if the same dimensions are shown in the same order.
+        labels = "|".join(dimension["label"] for dimension in dimensions)
+        uirevision = f"{run.id}:{inputs['budget_id']}:{inputs['objective_id']}:{labels}"
+
+        # The values are generated here and hence valid already. Validating them again takes
+        # a long time for many trials, which is why the figure is built without validation.
         figure = go.Figure(
-            data=go.Parcoords(
-                line=line,
-                dimensions=list([d for d in data.values()]),
-                labelangle=45,
-            ),
-            layout=dict(
-                margin=dict(t=150, b=50, l=100, r=0),
-                font=dict(size=config.FIGURE_FONT_SIZE),
+            dict(
+                data=[
+                    dict(
+                        type="parcoords",
+                        line=line,
+                        dimensions=dimensions,
+                        labelangle=45,
+                    )
+                ],
+                layout=dict(
+                    margin=dict(t=150, b=50, l=100, r=0),
+                    font=dict(size=config.FIGURE_FONT_SIZE),
+                    uirevision=uirevision,
+                ),
             ),
+            _validate=False,
         )
         save_image(figure, "parallel_coordinates.pdf")
 
@@ -121,6 +121,7 @@ class StaticPlugin(Plugin, ABC):
         self._refresh_required = True
         self._reset_button = False
         self._blocked = False
+        self._raw_outputs_key: Optional[str] = None  # Inputs key of `raw_outputs`
 
     @interactive
     def register_callbacks(self) -> None:
@@ -171,10 +172,23 @@ class StaticPlugin(Plugin, ABC):
             raw_outputs = {}
             raw_outputs_available = True
             for run in runs:
-                raw_outputs[run.id] = rc.get(run, self.id, inputs_key)
+                # Filters do not change the raw outputs. Hence, the raw outputs of the last call
+                # are reused instead of reading them from the cache again as long as they exist.
+                if (
+                    self.raw_outputs is not None
+                    and self._raw_outputs_key == inputs_key
+                    and run.id in self.raw_outputs
+                    and rc.exists(run, self.id, inputs_key)
+                ):
+                    raw_outputs[run.id] = self.raw_outputs[run.id]
+                else:
+                    raw_outputs[run.id] = rc.get(run, self.id, inputs_key)
 
                 if raw_outputs[run.id] is None:
                     raw_outputs_available = False
+                    # The cache entry is gone (e.g. the run changed), so the raw outputs of the
+                    # last call must not be reused once it is written again.
+                    self._raw_outputs_key = None
 
             # Process
             if raw_outputs_available:
@@ -186,6 +200,7 @@ class StaticPlugin(Plugin, ABC):
 
                     # Save for modal
                     self.raw_outputs = raw_outputs
+                    self._raw_outputs_key = inputs_key
 
                     outputs = self._process_raw_outputs(inputs, raw_outputs)
                     self._refresh_required = False
@@ -245,6 +260,7 @@ class StaticPlugin(Plugin, ABC):
                             # Save results in cache
                             # Same optional string problem
                             rc.set(run, job_plugin_id, job_inputs_key, job_run_outputs)
+                            self._raw_outputs_key = None
                             self.logger.debug(f"Job {job_id} cached.")
 
                             queue.delete_job(job_id)
@@ -27,6 +27,7 @@ It provides functions to get information of the run, as well as the used objecti
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
+import math
 from pathlib import Path
 
 import ConfigSpace
@@ -1222,7 +1223,7 @@ class AbstractRun(ABC):
         x = []
         for value, hp in zip(values, hps):
             # NaNs should be encoded as -0.5
-            if np.isnan(value):
+            if math.isnan(value):
                 value = NAN_VALUE
             # Categorical values should be between 0..1
             elif isinstance(hp, CategoricalHyperparameter):
@@ -1319,8 +1320,8 @@ class AbstractRun(ABC):
         results = self.get_all_costs(budget, statuses, seed)
         for config_id, config_costs in results.items():
             config = self.configs[config_id]
+            x = self.encode_config(config, specific=specific)
             for seed, costs in config_costs.items():
-                x = self.encode_config(config, specific=specific)
                 y = []
 
                 # Add all objectives
@@ -27,7 +27,7 @@ This module provides utilities for serializing and deserializing a dataframe fro
     - TYPE: TypeVar
 """
 
-from typing import Any, Dict, List, TypeVar, Union
+from typing import Any, Dict, List, Optional, TypeVar, Union
 
 import json
 
@@ -86,7 +86,9 @@ def serialize(data: Union[Dict, List, pd.DataFrame]) -> str:
     return json.dumps(data, cls=Encoder, separators=JSON_DENSE_SEPARATORS)
 
 
-def deserialize(string: str, dtype: TYPE = pd.DataFrame) -> TYPE:
+def deserialize(
+    string: str, dtype: TYPE = pd.DataFrame, columns: Optional[List[str]] = None
+) -> TYPE:
     """
     Deserialize a dataframe from a string.
 
@@ -97,6 +99,9 @@ def deserialize(string: str, dtype: TYPE = pd.DataFrame) -> TYPE:
     dtype : TYPE, optional
         The type of the object.
         Default is pd.DataFrame.
+    columns : Optional[List[str]], optional
+        Only these columns are deserialized if the object is a dataframe.
+        Default is None (all columns are deserialized).
 
     Returns
     -------
@@ -104,6 +109,10 @@ def deserialize(string: str, dtype: TYPE = pd.DataFrame) -> TYPE:
         The deserialized object.
     """
     if dtype == pd.DataFrame:
-        return pd.DataFrame.from_dict(json.loads(string))
+        data = json.loads(string)
+        if columns is not None:
+            data = {column: data[column] for column in columns}
+
+        return pd.DataFrame.from_dict(data)
 
     return json.loads(string)
@@ -19,6 +19,7 @@
 This module defines a class for holding the caches for selected runs.
 
 Utilities provided include updating, getting, setting and clearing.
+It also provides functions to keep intermediate results of a process in the cache.
 
 ## Classes
     - RunCaches: Hold the caches for the selected runs.
@@ -122,6 +123,26 @@ class RunCaches:
 
         cache.write()
 
+    def exists(self, run: AbstractRun, plugin_id: str, inputs_key: str) -> bool:
+        """
+        Check whether raw outputs are cached for the given run, plugin and inputs key.
+
+        Parameters
+        ----------
+        run : AbstractRun
+            The run to check the cache for.
+        plugin_id : str
+            The plugin id to check the cache for.
+        inputs_key : str
+            The inputs key to check the cache for. Should be the output from `Plugin._dict_as_key`.
+
+        Returns
+        -------
+        bool
+            True if raw outputs are cached.
+        """
+        return (self.cache_dir / run.id / plugin_id / f"{inputs_key}.json").exists()
+
     def get(self, run: AbstractRun, plugin_id: str, inputs_key: str) -> Optional[Dict[str, Any]]:
         """
         Return the raw outputs for the given run, plugin and inputs key.
@@ -186,3 +207,60 @@ class RunCaches:
             shutil.rmtree(self.cache_dir)
         except Exception:
             pass
+
+
+def load_from_run_cache(run: AbstractRun, cache_id: str, key: str) -> Optional[Dict[str, Any]]:
+    """
+    Load intermediate results from the run cache.
+
+    In contrast to `RunCaches.get`, this can be used from within a process, e.g. in a worker.
+    Nothing is loaded in API mode.
+
+    Parameters
+    ----------
+    run : AbstractRun
+        The run the results were calculated for.
+    cache_id : str
+        The id of the cache the results are stored in.
+    key : str
+        The key of the results.
+
+    Returns
+    -------
+    Optional[Dict[str, Any]]
+        The results if they were cached before, else None.
+    """
+    # Imported here because deepcave imports this module itself
+    from deepcave import _api_mode, config
+
+    if _api_mode:
+        return None
+
+    return RunCaches(config).get(run, cache_id, key)
+
+
+def save_to_run_cache(run: AbstractRun, cache_id: str, key: str, value: Dict[str, Any]) -> None:
+    """
+    Save intermediate results to the run cache.
+
+    In contrast to `RunCaches.set`, this can be used from within a process, e.g. in a worker.
+    Nothing is saved in API mode.
+
+    Parameters
+    ----------
+    run : AbstractRun
+        The run the results were calculated for.
+    cache_id : str
+        The id of the cache the results are stored in.
+    key : str
+        The key of the results.
+    value : Dict[str, Any]
+        The results to save.
+    """
+    # Imported here because deepcave imports this module itself
+    from deepcave import _api_mode, config
+
+    if _api_mode:
+        return
+
+    RunCaches(config).set(run, cache_id, key, value)
@@ -23,6 +23,7 @@ For this, it uses plotly as well as dash.
 from typing import Any, Callable, List, Optional, Tuple, Union
 
 import itertools
+import math
 import re
 
 import numpy as np
@@ -326,7 +327,7 @@ def get_hyperparameter_ticks(
             if additional_values is not None:
                 # Now add additional values are added
                 for value in additional_values:
-                    if not (value is None or np.isnan(value) or value == NAN_VALUE):
+                    if not (value is None or math.isnan(value) or value == NAN_VALUE):
                         label = hp.to_value(value)
                         value = hp.to_vector(label)
 
@@ -342,7 +343,7 @@ def get_hyperparameter_ticks(
                 # Now additional values are added
                 for value in additional_values:
                     if (
-                        not (value is None or np.isnan(value) or value == NAN_VALUE)
+                        not (value is None or math.isnan(value) or value == NAN_VALUE)
                         and value not in tickvals
                     ):
                         tickvals += [value]
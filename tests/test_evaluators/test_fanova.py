@@ -54,6 +54,27 @@ class TestFanova(unittest.TestCase):
         # Same seed: Same results
         assert importances["batch_size"][1] == importances2["batch_size"][1]
 
+    def test_max_samples(self):
+        budget = self.run.get_budget(0)
+        objective = self.run.get_objective(0)
+        n_samples = len(self.run.get_encoded_data(objective, budget))
+
+        # Calculate
+        self.evaluator.calculate(objective, budget, seed=0)
+        importances = self.evaluator.get_importances(self.hp_names)
+
+        self.evaluator.calculate(objective, budget, seed=0, max_samples=n_samples)
+        importances2 = self.evaluator.get_importances(self.hp_names)
+
+        self.evaluator.calculate(objective, budget, seed=0, max_samples=n_samples // 2)
+        importances3 = self.evaluator.get_importances(self.hp_names)
+
+        # All samples: Same results
+        assert importances["batch_size"][1] == importances2["batch_size"][1]
+
+        # Fewer samples: Different results
+        assert importances["batch_size"][1] != importances3["batch_size"][1]
+
 
 if __name__ == "__main__":
     unittest.main()
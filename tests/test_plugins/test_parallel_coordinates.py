@@ -0,0 +1,89 @@
+# Copyright 2021-2024 The DeepCAVE Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import List, Optional
+
+import json
+import unittest
+
+import plotly.graph_objs as go
+
+from deepcave.plugins.hyperparameter.parallel_coordinates import ParallelCoordinates
+from deepcave.runs import AbstractRun
+from deepcave.runs.converters.smac3v1 import SMAC3v1Run
+
+
+class TestParallelCoordinates(unittest.TestCase):
+    def setUp(self):
+        # Initiate run here
+        self.run: AbstractRun = SMAC3v1Run.from_path("logs/SMAC3v1/mlp/run_1")
+        self.hp_names = list(self.run.configspace.keys())
+
+    def get_figure(
+        self,
+        show_important_only: bool,
+        n_hps: int,
+        hp_names: Optional[List[str]] = None,
+        show_unsuccessful: bool = False,
+    ) -> go.Figure:
+        if hp_names is None:
+            hp_names = self.hp_names
+
+        inputs = {"objective_id": 0, "budget_id": 0, "show_important_only": show_important_only}
+        # Raw outputs are passed as JSON between process and load_outputs
+        outputs = json.loads(json.dumps(ParallelCoordinates.process(self.run, inputs)))
+        inputs.update(
+            {
+                "show_unsuccessful": show_unsuccessful,
+                "n_hps": n_hps,
+                "hyperparameter_names": hp_names,
+            }
+        )
+
+        return ParallelCoordinates.load_outputs(self.run, inputs, outputs)
+
+    def get_n_dimensions(self, show_important_only: bool, n_hps: int) -> int:
+        return len(self.get_figure(show_important_only, n_hps).data[0].dimensions)
+
+    def test_n_hps(self):
+        # The objective is shown in addition to the hyperparameters
+        for show_important_only in [False, True]:
+            assert self.get_n_dimensions(show_important_only, 2) == 3
+            assert self.get_n_dimensions(show_important_only, len(self.hp_names)) == (
+                len(self.hp_names) + 1
+            )
+
+    def test_n_hps_exceeding(self):
+        # Not more hyperparameters than available are shown
+        for show_important_only in [False, True]:
+            n_dimensions = self.get_n_dimensions(show_important_only, len(self.hp_names) + 2)
+            assert n_dimensions == len(self.hp_names) + 1
+
+    def test_uirevision(self):
+        # The UI state is only kept if the same dimensions are shown
+        for show_important_only in [False, True]:
+            revision = self.get_figure(show_important_only, 3).layout.uirevision
+            assert self.get_figure(show_important_only, 3).layout.uirevision == revision
+            assert self.get_figure(show_important_only, 2).layout.uirevision != revision
+
+            figure = self.get_figure(show_important_only, 3, show_unsuccessful=True)
+            assert figure.layout.uirevision != revision
+
+        revision = self.get_figure(False, 3).layout.uirevision
+        figure = self.get_figure(False, 3, hp_names=self.hp_names[::-1])
+        assert figure.layout.uirevision != revision
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -162,6 +162,15 @@ class TestCompression(unittest.TestCase):
         self.assertIsInstance(df_cycled, pd.DataFrame)
         self.assertTrue(all((df_cycled.to_numpy() == df.to_numpy()).reshape(-1)))
 
+    def test_dataframe_columns_conversion(self):
+        df = pd.DataFrame({"a": [1, 2], "b": [3.0, None], "c": ["x", "y"]})
+
+        df_ser = serialize(df)
+        df_cycled = deserialize(df_ser, dtype=pd.DataFrame, columns=["c", "a"])
+        self.assertIsInstance(df_cycled, pd.DataFrame)
+        self.assertEqual(["c", "a"], list(df_cycled.columns))
+        self.assertTrue(all((df_cycled.to_numpy() == df[["c", "a"]].to_numpy()).reshape(-1)))
+
 
 class TestDataStructures(unittest.TestCase):
     def test_update_dict(self):